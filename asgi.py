@@ -11,6 +11,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+# The event loop is chosen by the ASGI server, not here. Use uvloop with
+# e.g. `uvicorn asgi:application --loop uvloop`; Daphne runs on its own
+# Twisted asyncio reactor, which is set up before this module loads.
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
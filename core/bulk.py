@@ -0,0 +1,24 @@
+from typing import Iterable, List, Sequence, Type
+
+from django.db.models import Model
+
+
+def bulk_upsert(
+    model: Type[Model],
+    rows: Iterable[Model],
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+    batch_size: int = 500,
+) -> List[Model]:
+    """
+    Insert rows, updating update_fields on rows that conflict on
+    unique_fields. Issues one INSERT ... ON CONFLICT per batch instead
+    of a get and save per row, so seed data scales with batch count.
+    """
+    return model.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=update_fields,
+    )
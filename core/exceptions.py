@@ -0,0 +1,18 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import exception_handler as drf_exception_handler
+
+
+def exception_handler(exc, context):
+    """
+    Wrap validation errors in the standardized response format.
+    Other exceptions use DRF's default handling.
+    """
+    response = drf_exception_handler(exc, context)
+    if response is not None and isinstance(exc, ValidationError):
+        response.data = {
+            "data": None,
+            "message": "Validation error",
+            "errors": response.data,
+            "status": "error"
+        }
+    return response
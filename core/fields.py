@@ -12,8 +12,20 @@ class LowercaseEmailField(models.EmailField):
     def get_prep_value(self, value):
         """
         Convert the email to lowercase before saving to database.
+        Models should also declare a UniqueConstraint on Lower(field)
+        so writes that bypass this method stay case-insensitively unique.
         """
+        if isinstance(value, str):
+            return value.lower()
         value = super().get_prep_value(value)
         if value is not None:
             value = value.lower()
         return value
+
+    @staticmethod
+    def normalize_many(values):
+        """
+        Lowercase a batch of emails, e.g. before bulk_create.
+        Empty values are passed through unchanged.
+        """
+        return [value.lower() if value else value for value in values]
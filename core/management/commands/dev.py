@@ -34,18 +34,12 @@ class Command(BaseCommand):
             "username": os.environ.get("LOCAL_DEV_USERNAME", "a@a.com"),
             "password": os.environ.get("LOCAL_DEV_PASSWORD", "a"),
         }
-        params = {
-            "email": auth_params["username"],
-            "is_staff": True,
-            "is_superuser": True,
-        }
-        try:
-            user = get_user_model().objects.get(email=params["email"])
-        except Exception:
-            user = get_user_model().objects.create(**params)
-
+        user, _ = get_user_model().objects.get_or_create(
+            email=auth_params["username"],
+            defaults={"is_staff": True, "is_superuser": True},
+        )
         user.set_password(auth_params["password"])
-        user.save()
+        user.save(update_fields=["password"])
 
         logger.info("########################################")
         logger.info("You can log in with:")
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by newest first, with pk as tie-breaker.
+    Avoids the COUNT(*) query that page-number pagination runs.
+    Models without a created_at field must override ordering.
+    """
+    ordering = ('-created_at', '-pk')
+    page_size = 50
@@ -0,0 +1,30 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+def dumps(data) -> bytes:
+    """
+    Serialize data to JSON bytes with orjson.
+    Types orjson does not know (lazy strings, Decimal, etc.) fall back
+    to DRF's encoder. Non-str keys are allowed because ListField and
+    DictField errors are keyed by index.
+    """
+    return orjson.dumps(
+        data,
+        default=_encoder.default,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson instead of the stdlib json module.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps(data)
@@ -0,0 +1,23 @@
+import copy
+
+from rest_framework import serializers
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+    ModelSerializer introspects the model on every instantiation; this
+    caches the result and hands each instance a deep copy, since fields
+    are bound to their parent serializer.
+    Only use it when get_fields() does not depend on context or the
+    instance.
+    """
+    _cached_fields = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsModelSerializer._cached_fields.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsModelSerializer._cached_fields[cls] = fields
+        return copy.deepcopy(fields)
@@ -88,6 +88,18 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Seconds to keep connections open between requests. Off by default:
+        # under ASGI, Django 4.2 runs sync DB work in per-request threads,
+        # so persistent connections are not reused and pile up instead
+        # (ticket #33497). Opt in for WSGI deployments, or put PgBouncer
+        # in front of Postgres for ASGI.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
+        # Set to True behind PgBouncer in transaction pooling mode
+        'DISABLE_SERVER_SIDE_CURSORS': (
+            os.environ.get('DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower()
+            == 'true'
+        ),
     }
 }
 
@@ -145,6 +157,11 @@ STATIC_URL = '/static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Django REST framework
+REST_FRAMEWORK = {
+    'EXCEPTION_HANDLER': 'core.exceptions.exception_handler',
+}
+
 # Custom user model
 AUTH_USER_MODEL = 'user.User'
 
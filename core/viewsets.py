@@ -1,7 +1,12 @@
+from functools import lru_cache
+
 from rest_framework import viewsets, status
 from rest_framework.response import Response
-from typing import Type, Optional
-from django.db.models import Model
+from typing import Type, Optional, Tuple, Union
+from django.db.models import Model, Prefetch
+
+from core.pagination import StandardCursorPagination
+from core.renderers import ORJSONRenderer
 
 
 class BaseModelViewSet(viewsets.ModelViewSet):
@@ -9,18 +14,58 @@ class BaseModelViewSet(viewsets.ModelViewSet):
     Base viewset that provides default CRUD
     operations with standardized responses.
     Supports separate serializers for list and detail views.
+
+    Subclasses can set ``select_related_fields`` and
+    ``prefetch_related_fields`` so related objects are loaded up front
+    instead of one query per row. ``prefetch_related_fields`` accepts
+    lookup strings or ``Prefetch`` objects.
+
+    ``list_only_fields`` narrows the columns loaded by the list action
+    with ``.only()``. The list serializer must not read fields outside
+    this set, otherwise each row triggers a lazy refetch. It must also
+    include the pagination ordering columns (``created_at`` by default),
+    since building the cursor reads them from every row on the page.
+
+    Lists are cursor paginated on ``-created_at`` then ``-pk``, with the
+    cursor links returned inside the standardized response. Viewsets for
+    models without ``created_at`` must set their own ``pagination_class``.
+
+    When ``owner_field`` is set, the queryset is limited to rows owned
+    by the authenticated user, and is empty for anonymous requests.
+
+    Responses are rendered with orjson.
     """
     model_class: Optional[Type[Model]] = None
     serializer_class = None
     list_serializer_class = None
+    pagination_class = StandardCursorPagination
+    renderer_classes = [ORJSONRenderer]
+    select_related_fields: Tuple[str, ...] = ()
+    prefetch_related_fields: Tuple[Union[str, Prefetch], ...] = ()
+    list_only_fields: Tuple[str, ...] = ()
+    owner_field: Optional[str] = None
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _resolve_serializer_class(cls, action):
+        """
+        Resolve the serializer class for an action once per viewset class.
+        """
+        if action == 'list' and cls.list_serializer_class is not None:
+            return cls.list_serializer_class
+        return cls.serializer_class
 
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action.
         """
-        if self.action == 'list' and self.list_serializer_class is not None:
-            return self.list_serializer_class
-        return super().get_serializer_class()
+        serializer_class = self._resolve_serializer_class(self.action)
+        assert serializer_class is not None, (
+            "'%s' should either include a `serializer_class` attribute, "
+            "or override the `get_serializer_class()` method."
+            % self.__class__.__name__
+        )
+        return serializer_class
 
     def get_queryset(self):
         """
@@ -28,31 +73,36 @@ class BaseModelViewSet(viewsets.ModelViewSet):
         """
         if self.model_class is None:
             raise ValueError("model_class must be defined")
-        return self.model_class.objects.all()
+        queryset = self.model_class.objects.all()
+        if self.owner_field:
+            if not self.request.user.is_authenticated:
+                return queryset.none()
+            queryset = queryset.filter(
+                **{self.owner_field: self.request.user}
+            )
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(
+                *self.prefetch_related_fields
+            )
+        return queryset
 
     def create(self, request, *args, **kwargs):
         """
         Create a new instance with standardized response format.
+        Validation errors are formatted by core.exceptions.exception_handler.
         """
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            self.perform_create(serializer)
-            return Response(
-                {
-                    "data": serializer.data,
-                    "message": "Created successfully",
-                    "status": "success"
-                },
-                status=status.HTTP_201_CREATED
-            )
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
         return Response(
             {
-                "data": None,
-                "message": "Validation error",
-                "errors": serializer.errors,
-                "status": "error"
+                "data": serializer.data,
+                "message": "Created successfully",
+                "status": "success"
             },
-            status=status.HTTP_400_BAD_REQUEST
+            status=status.HTTP_201_CREATED
         )
 
     def update(self, request, *args, **kwargs):
@@ -66,24 +116,14 @@ class BaseModelViewSet(viewsets.ModelViewSet):
             data=request.data,
             partial=partial
         )
-
-        if serializer.is_valid():
-            self.perform_update(serializer)
-            return Response(
-                {
-                    "data": serializer.data,
-                    "message": "Updated successfully",
-                    "status": "success"
-                }
-            )
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
         return Response(
             {
-                "data": None,
-                "message": "Validation error",
-                "errors": serializer.errors,
-                "status": "error"
-            },
-            status=status.HTTP_400_BAD_REQUEST
+                "data": serializer.data,
+                "message": "Updated successfully",
+                "status": "success"
+            }
         )
 
     def destroy(self, request, *args, **kwargs):
@@ -106,6 +146,8 @@ class BaseModelViewSet(viewsets.ModelViewSet):
         List instances with standardized response format.
         """
         queryset = self.filter_queryset(self.get_queryset())
+        if self.list_only_fields and self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
         page = self.paginate_queryset(queryset)
 
         if page is not None:
@@ -121,6 +163,20 @@ class BaseModelViewSet(viewsets.ModelViewSet):
             }
         )
 
+    def get_paginated_response(self, data):
+        """
+        Wrap a page in the standardized response format.
+        """
+        return Response(
+            {
+                "data": data,
+                "next": self.paginator.get_next_link(),
+                "previous": self.paginator.get_previous_link(),
+                "message": "Retrieved successfully",
+                "status": "success"
+            }
+        )
+
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve an instance with standardized response format.
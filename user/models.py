@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from core.fields import LowercaseEmailField
 
 
@@ -32,6 +33,12 @@ class User(AbstractUser):
 
     class Meta:
         verbose_name_plural = 'Users'
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                name='user_email_lower_uniq'
+            ),
+        ]
 
     def __str__(self):
         return self.username
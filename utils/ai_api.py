@@ -1,21 +1,122 @@
 """Utility module for RAG operations using Claude and ChromaDB."""
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
+import asyncio
 import os
+import string
+import threading
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 
-from anthropic import Anthropic
+import structlog
+from anthropic import AsyncAnthropic
 from chromadb import PersistentClient
+from chromadb.api import ClientAPI
 from dotenv import load_dotenv
-from langchain.chains import RetrievalQA
-from langchain.prompts import PromptTemplate
 from langchain_anthropic import ChatAnthropic
 from langchain_community.vectorstores import Chroma
 from langchain_community.embeddings import HuggingFaceHubEmbeddings
+from langchain_core.documents import Document
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import Runnable
 from langchain_core.vectorstores import VectorStore
 from langchain_core.language_models import BaseChatModel
 
+logger = structlog.getLogger(__name__)
 
-@dataclass
+# Documents per embedding request and maximum requests in flight
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_CONCURRENCY = 8
+
+# MMR picks k diverse chunks out of the fetch_k most similar ones
+RETRIEVER_SEARCH_KWARGS = {"k": 3, "fetch_k": 20, "lambda_mult": 0.5}
+
+# Batches the scheduler runs at once, questions per batch, and how long
+# a caller waits for an answer
+SCHEDULER_CONCURRENCY = 8
+SCHEDULER_MAX_BATCH = 32
+SCHEDULER_TIMEOUT = 120.0
+
+# Answers kept for repeated (question, retrieved documents) pairs
+ANSWER_CACHE_SIZE = 1024
+
+PROMPT_VARIABLES = frozenset({"context", "question"})
+
+
+@lru_cache(maxsize=4)
+def get_chroma_client(persist_directory: str) -> ClientAPI:
+    """Return a shared ChromaDB client for a persist directory.
+
+    Args:
+        persist_directory: Directory where the vector database is stored.
+
+    Returns:
+        ClientAPI: Client reused across calls with the same directory.
+    """
+    return PersistentClient(path=persist_directory)
+
+
+def format_docs(docs: List[Document]) -> str:
+    """Join retrieved documents into a single context string."""
+    return "\n\n".join(doc.page_content for doc in docs)
+
+
+def compile_prompt(template: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a prompt template into literal text and variable names once.
+
+    Args:
+        template: Template using {context} and {question} placeholders.
+
+    Returns:
+        List of (literal, variable) pairs; variable is None at the end.
+
+    Raises:
+        ValueError: If the template uses any other variable, including
+            positional ({}) or indexed ({0}) fields, or a conversion or
+            format spec ({context!r}, {question:>40}).
+    """
+    parsed = list(string.Formatter().parse(template))
+    unknown = {
+        field for _, field, _, _ in parsed if field is not None
+    } - PROMPT_VARIABLES
+    unknown.update(
+        "{%s%s%s}" % (
+            field,
+            f"!{conversion}" if conversion else "",
+            f":{spec}" if spec else "",
+        )
+        for _, field, spec, conversion in parsed
+        if field is not None and (spec or conversion)
+    )
+    if unknown:
+        names = ", ".join(repr(field) for field in sorted(unknown))
+        raise ValueError(f"Unsupported prompt variables: {names}")
+    return [(literal, field) for literal, field, _, _ in parsed]
+
+
+def render_prompt(
+    pieces: List[Tuple[str, Optional[str]]], values: Dict[str, str]
+) -> str:
+    """Fill a compiled prompt template.
+
+    Args:
+        pieces: Output of compile_prompt.
+        values: Text for each template variable.
+
+    Returns:
+        str: The formatted prompt.
+    """
+    parts = []
+    for literal, field in pieces:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+@dataclass(slots=True)
 class RAGResponse:
     """Structured response from RAG queries."""
 
@@ -50,8 +151,9 @@ class ClaudeLLMHelper:
                 "HuggingFace API key not found in environment variables"
             )
 
-        # Direct Anthropic client for custom calls
-        self.client = Anthropic(api_key=self.anthropic_api_key)
+        # Direct Anthropic client for custom calls. Its connection pool is
+        # bound to the current event loop; see get_helper()
+        self.client = AsyncAnthropic(api_key=self.anthropic_api_key)
 
         # LangChain integration for RAG
         self.llm: BaseChatModel = ChatAnthropic(
@@ -68,9 +170,13 @@ class ClaudeLLMHelper:
         )
 
         self.vector_store: Optional[VectorStore] = None
-        self.qa_chain: Optional[RetrievalQA] = None
+        self.retriever: Optional[BaseRetriever] = None
+        self.qa_chain: Optional[Runnable] = None
+        self.scheduler: Optional["RAGScheduler"] = None
+        self._prompt_pieces: List[Tuple[str, Optional[str]]] = []
+        self._answer_cache: OrderedDict = OrderedDict()
 
-    def create_vector_store(
+    async def create_vector_store(
         self,
         documents: List[str],
         collection_name: str = "default_collection",
@@ -78,6 +184,8 @@ class ClaudeLLMHelper:
     ) -> bool:
         """Create a vector store from a list of documents.
 
+        This is a coroutine and must be awaited.
+
         Args:
             documents: List of text documents to store.
             collection_name: Name for the ChromaDB collection.
@@ -87,7 +195,7 @@ class ClaudeLLMHelper:
             bool: True if successful, False otherwise.
         """
         try:
-            client = PersistentClient(path=persist_directory)
+            client = get_chroma_client(persist_directory)
 
             self.vector_store = Chroma(
                 client=client,
@@ -95,13 +203,48 @@ class ClaudeLLMHelper:
                 embedding_function=self.embeddings,
             )
 
-            self.vector_store.add_texts(documents)
+            if documents:
+                vectors = await self._embed_documents(documents)
+                # Chroma.add_texts would embed again; write the vectors
+                # straight to the wrapper's collection instead
+                await asyncio.to_thread(
+                    self.vector_store._collection.add,
+                    ids=[str(uuid.uuid4()) for _ in documents],
+                    embeddings=vectors,
+                    documents=documents,
+                )
             return True
 
-        except Exception as exc:
-            print(f"Error creating vector store: {str(exc)}")
+        except Exception:
+            logger.exception(
+                "create_vector_store_failed", collection=collection_name
+            )
             return False
 
+    async def _embed_documents(
+        self, documents: List[str]
+    ) -> List[List[float]]:
+        """Embed documents in concurrent batches.
+
+        Args:
+            documents: List of text documents to embed.
+
+        Returns:
+            List of embedding vectors in the same order as documents.
+        """
+        semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch)
+
+        batches = [
+            documents[start:start + EMBEDDING_BATCH_SIZE]
+            for start in range(0, len(documents), EMBEDDING_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(embed_batch(b) for b in batches))
+        return [vector for batch in results for vector in batch]
+
     def load_vector_store(
         self,
         collection_name: str = "default_collection",
@@ -117,7 +260,7 @@ class ClaudeLLMHelper:
             bool: True if successful, False otherwise.
         """
         try:
-            client = PersistentClient(path=persist_directory)
+            client = get_chroma_client(persist_directory)
 
             self.vector_store = Chroma(
                 client=client,
@@ -125,8 +268,10 @@ class ClaudeLLMHelper:
                 embedding_function=self.embeddings,
             )
             return True
-        except Exception as exc:
-            print(f"Error loading vector store: {str(exc)}")
+        except Exception:
+            logger.exception(
+                "load_vector_store_failed", collection=collection_name
+            )
             return False
 
     def setup_qa_chain(self, custom_prompt: Optional[str] = None) -> None:
@@ -136,7 +281,8 @@ class ClaudeLLMHelper:
             custom_prompt: Optional custom prompt template.
 
         Raises:
-            ValueError: If vector store is not initialized.
+            ValueError: If vector store is not initialized or the prompt
+                uses variables other than context and question.
         """
         if not self.vector_store:
             raise ValueError(
@@ -152,20 +298,14 @@ class ClaudeLLMHelper:
             "Answer:"
         )
 
-        prompt = PromptTemplate(
-            template=custom_prompt or default_prompt,
-            input_variables=["context", "question"],
-        )
+        self._prompt_pieces = compile_prompt(custom_prompt or default_prompt)
+        self._answer_cache.clear()
 
-        self.qa_chain = RetrievalQA.from_chain_type(
-            llm=self.llm,
-            chain_type="stuff",
-            retriever=self.vector_store.as_retriever(
-                search_kwargs={"k": 3}  # Number of relevant chunks to return
-            ),
-            return_source_documents=True,
-            chain_type_kwargs={"prompt": prompt},
+        self.retriever = self.vector_store.as_retriever(
+            search_type="mmr",
+            search_kwargs=RETRIEVER_SEARCH_KWARGS,
         )
+        self.qa_chain = self.llm | StrOutputParser()
 
     async def query(self, question: str) -> RAGResponse:
         """Query Claude with RAG context using LangChain.
@@ -187,21 +327,81 @@ class ClaudeLLMHelper:
             )
 
         try:
-            response = await self.qa_chain.ainvoke({"query": question})
-            return RAGResponse(
-                answer=response["result"],
-                sources=[
-                    doc.page_content for doc in response["source_documents"]
-                ],
-                error=None,
-            )
+            if self.scheduler is not None:
+                return await self.scheduler.submit(question)
+            docs = await self.retriever.ainvoke(question)
+            return await self.answer(question, docs)
         except Exception as exc:
+            logger.exception("rag_query_failed")
             return RAGResponse(
                 answer=None,
                 sources=None,
                 error=str(exc),
             )
 
+    async def answer(
+        self, question: str, docs: List[Document]
+    ) -> RAGResponse:
+        """Answer a question from already retrieved documents.
+
+        Args:
+            question: The question to ask.
+            docs: Context documents returned by retrieval.
+
+        Returns:
+            RAGResponse: Contains the answer and its sources.
+        """
+        doc_keys = tuple(
+            getattr(doc, "id", None) or doc.page_content for doc in docs
+        )
+        key = (question, doc_keys)
+        answer = self._answer_cache.get(key)
+        if answer is None:
+            answer = await self.qa_chain.ainvoke(
+                self._format_prompt(question, docs)
+            )
+            self._answer_cache[key] = answer
+            if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
+        else:
+            self._answer_cache.move_to_end(key)
+        return RAGResponse(
+            answer=answer,
+            sources=[doc.page_content for doc in docs],
+            error=None,
+        )
+
+    async def stream_query(self, question: str) -> AsyncIterator[str]:
+        """Stream Claude's answer to a question with RAG context.
+
+        Args:
+            question: The question to ask.
+
+        Yields:
+            str: Chunks of the answer as they are generated.
+
+        Raises:
+            ValueError: If the QA chain is not initialized.
+        """
+        if not self.qa_chain:
+            raise ValueError(
+                "QA chain not initialized. "
+                "Please run setup_qa_chain first."
+            )
+
+        docs = await self.retriever.ainvoke(question)
+        async for chunk in self.qa_chain.astream(
+            self._format_prompt(question, docs)
+        ):
+            yield chunk
+
+    def _format_prompt(self, question: str, docs: List[Document]) -> str:
+        """Build the prompt for a question from retrieved documents."""
+        return render_prompt(
+            self._prompt_pieces,
+            {"context": format_docs(docs), "question": question},
+        )
+
     async def direct_query(
         self, system_prompt: str, user_message: str
     ) -> Dict[str, Any]:
@@ -215,7 +415,7 @@ class ClaudeLLMHelper:
             Dict containing either the response or error message.
         """
         try:
-            message = self.client.messages.create(
+            message = await self.client.messages.create(
                 model="claude-3-sonnet-20240229",
                 max_tokens=1000,
                 system=system_prompt,
@@ -223,12 +423,222 @@ class ClaudeLLMHelper:
             )
             return {"content": message.content, "error": None}
         except Exception as exc:
+            logger.exception("direct_query_failed")
             return {"content": None, "error": str(exc)}
 
+    async def aclose(self) -> None:
+        """Stop the scheduler and close the Anthropic client's connections.
+
+        Must run on the event loop that created the helper.
+        """
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+            self.scheduler = None
+        await self.client.close()
+
+
+class RAGScheduler:
+    """Queue-backed dispatcher that keeps many RAG queries in flight.
+
+    One dispatcher coroutine drains the queue and hands each batch to its
+    own task, with up to ``concurrency`` batches running at once.
+    Questions that queue up while every slot is busy are embedded together
+    in one request, so batches grow with load without delaying queries
+    when the scheduler is idle. Chroma retrieval runs in a thread and
+    generation on the event loop, so no stage blocks the others.
+
+    A scheduler is bound to the event loop it was started on.
+    """
+
+    def __init__(
+        self,
+        helper: ClaudeLLMHelper,
+        concurrency: int = SCHEDULER_CONCURRENCY,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            helper: Helper with a loaded vector store and QA chain.
+            concurrency: Maximum number of batches processed at once.
+        """
+        self.helper = helper
+        self.concurrency = concurrency
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the dispatcher, or restart it if it has exited."""
+        if self._dispatcher is not None and not self._dispatcher.done():
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        """Cancel the dispatcher and running batches, and wait for them."""
+        tasks = list(self._batches)
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._batches.clear()
+
+    async def submit(
+        self, question: str, timeout: float = SCHEDULER_TIMEOUT
+    ) -> RAGResponse:
+        """Queue a question and wait for its answer.
+
+        Args:
+            question: The question to ask.
+            timeout: Seconds to wait before giving up.
 
-# Example Django view
+        Returns:
+            RAGResponse: The answer and its sources.
+
+        Raises:
+            TimeoutError: If no answer arrives within timeout.
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((question, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"RAG query timed out after {timeout} seconds"
+            ) from None
+
+    async def _dispatch(self) -> None:
+        """Collect queued questions into batches and start each one."""
+        while True:
+            batch = [await self._queue.get()]
+            await self._slots.acquire()
+            # Questions queued while waiting for a free slot join the batch
+            while len(batch) < SCHEDULER_MAX_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, batch: List[Tuple[str, asyncio.Future]]
+    ) -> None:
+        """Embed a batch of questions in one request, then answer each."""
+        try:
+            # Skip questions whose caller already timed out
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                return
+            try:
+                vectors = await self.helper.embeddings.aembed_documents(
+                    [question for question, _ in batch]
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+
+            await asyncio.gather(
+                *(
+                    self._process(question, vector, future)
+                    for (question, future), vector in zip(batch, vectors)
+                )
+            )
+        finally:
+            self._slots.release()
+
+    async def _process(
+        self, question: str, vector: List[float], future: asyncio.Future
+    ) -> None:
+        """Retrieve context for one embedded question and answer it."""
+        store = self.helper.vector_store
+        try:
+            docs = await asyncio.to_thread(
+                store.max_marginal_relevance_search_by_vector,
+                vector,
+                **RETRIEVER_SEARCH_KWARGS,
+            )
+            response = await self.helper.answer(question, docs)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(response)
+
+
+# Helpers and their creation locks, one per event loop. The helper's
+# clients, queue and tasks only work on the loop that created them.
+_HELPERS: Dict[asyncio.AbstractEventLoop, ClaudeLLMHelper] = {}
+_HELPER_LOCKS: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _helper_lock(loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+    """Return the creation lock for a loop, dropping closed loops' entries."""
+    with _REGISTRY_LOCK:
+        for stale in [key for key in _HELPER_LOCKS if key.is_closed()]:
+            _HELPER_LOCKS.pop(stale, None)
+            _HELPERS.pop(stale, None)
+        return _HELPER_LOCKS.setdefault(loop, asyncio.Lock())
+
+
+async def get_helper() -> ClaudeLLMHelper:
+    """Return the helper for the running event loop, creating it on first use.
+
+    The helper loads the default vector store, sets up the QA chain and
+    gets a RAGScheduler once per loop, so requests on that loop share its
+    API clients and Chroma connection. Under an ASGI server there is a
+    single loop, so this is one helper per process. Under runserver each
+    async request runs on its own loop and gets a fresh helper.
+
+    Returns:
+        ClaudeLLMHelper: Ready-to-query helper.
+
+    Raises:
+        ValueError: If API keys are missing or the vector store fails to load.
+    """
+    loop = asyncio.get_running_loop()
+    helper = _HELPERS.get(loop)
+    if helper is None:
+        async with _helper_lock(loop):
+            helper = _HELPERS.get(loop)
+            if helper is None:
+                helper = ClaudeLLMHelper()
+                helper.load_vector_store()
+                helper.setup_qa_chain()
+                helper.scheduler = RAGScheduler(helper)
+                with _REGISTRY_LOCK:
+                    _HELPERS[loop] = helper
+    helper.scheduler.start()
+    return helper
+
+
+async def close_helper() -> None:
+    """Close the helper for the running event loop, if one was created.
+
+    Nothing in this project calls this yet. Django's ASGI handler has no
+    lifespan support, so a clean shutdown needs a server or wrapper that
+    calls it on the serving loop. Helpers that are never closed leave
+    their HTTP connections to be dropped at process exit.
+    """
+    loop = asyncio.get_running_loop()
+    with _REGISTRY_LOCK:
+        helper = _HELPERS.pop(loop, None)
+    if helper is not None:
+        await helper.aclose()
+
+
+# Example Django views
 """
-from django.http import JsonResponse
+from dataclasses import asdict
+
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 import json
@@ -243,13 +653,25 @@ async def rag_query(request):
         if not question:
             return JsonResponse({"error": "No question provided"}, status=400)
 
-        llm_helper = ClaudeLLMHelper()
-        llm_helper.load_vector_store()
-        llm_helper.setup_qa_chain()
-
+        llm_helper = await get_helper()
         response = await llm_helper.query(question)
-        return JsonResponse(response.__dict__)
+        return JsonResponse(asdict(response))
 
     except Exception as exc:
         return JsonResponse({"error": str(exc)}, status=500)
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def rag_stream(request):
+    data = json.loads(request.body)
+    question = data.get("question")
+
+    if not question:
+        return JsonResponse({"error": "No question provided"}, status=400)
+
+    llm_helper = await get_helper()
+    return StreamingHttpResponse(
+        llm_helper.stream_query(question),
+        content_type="text/plain; charset=utf-8",
+    )
 """
@@ -0,0 +1,210 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+from unittest.mock import patch
+
+try:
+    from utils import ai_api
+except ImportError:  # pragma: no cover
+    ai_api = None
+
+SKIP_REASON = "RAG dependencies (langchain, chromadb, anthropic) not installed"
+
+
+class StubEmbeddings:
+    """Records each embedding request; can block on an event or fail."""
+
+    def __init__(self, gate=None, error=None):
+        self.calls = []
+        self.gate = gate
+        self.error = error
+
+    async def aembed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+class StubVectorStore:
+    def max_marginal_relevance_search_by_vector(self, vector, **kwargs):
+        return [vector]
+
+
+class StubHelper:
+    """Stands in for ClaudeLLMHelper without API keys or network access."""
+
+    def __init__(self, embeddings=None):
+        self.embeddings = embeddings or StubEmbeddings()
+        self.vector_store = StubVectorStore()
+        self.scheduler = None
+
+    def load_vector_store(self):
+        return True
+
+    def setup_qa_chain(self):
+        pass
+
+    async def answer(self, question, docs):
+        return (question, docs)
+
+
+class StubChain:
+    """Records each prompt sent to the LLM and returns a numbered answer."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        return f"answer {len(self.prompts)}"
+
+
+@skipIf(ai_api is None, SKIP_REASON)
+class PromptTemplateTests(TestCase):
+    def test_render_fills_variables_and_unescapes_braces(self):
+        pieces = ai_api.compile_prompt(
+            "{{json}} Context: {context}\nQuestion: {question} {{end}}"
+        )
+        self.assertEqual(
+            ai_api.render_prompt(pieces, {"context": "C", "question": "Q"}),
+            "{json} Context: C\nQuestion: Q {end}",
+        )
+
+    def test_render_matches_str_format(self):
+        template = "Use {context}.\n\n{question}?\nAnswer:"
+        values = {"context": "ctx", "question": "why"}
+        self.assertEqual(
+            ai_api.render_prompt(ai_api.compile_prompt(template), values),
+            template.format(**values),
+        )
+
+    def test_unsupported_fields_are_rejected(self):
+        for template in (
+            "{context} {}",
+            "{context} {0}",
+            "{context.x}",
+            "{question[0]}",
+            "{other}",
+            "{context!r}",
+            "{question:>40}",
+        ):
+            with self.subTest(template=template):
+                with self.assertRaises(ValueError):
+                    ai_api.compile_prompt(template)
+
+
+@skipIf(ai_api is None, SKIP_REASON)
+class AnswerCacheTests(IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = patch.object(ai_api, "ANSWER_CACHE_SIZE", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.helper = ai_api.ClaudeLLMHelper.__new__(ai_api.ClaudeLLMHelper)
+        self.helper.qa_chain = StubChain()
+        self.helper._prompt_pieces = ai_api.compile_prompt(
+            "{context}|{question}"
+        )
+        self.helper._answer_cache = ai_api.OrderedDict()
+        self.docs = [ai_api.Document(page_content="shirt")]
+
+    async def ask(self, question):
+        return await self.helper.answer(question, self.docs)
+
+    async def test_repeat_question_is_served_from_cache(self):
+        first = await self.ask("a")
+        second = await self.ask("a")
+
+        self.assertEqual(first.answer, second.answer)
+        self.assertEqual(second.sources, ["shirt"])
+        self.assertEqual(self.helper.qa_chain.prompts, ["shirt|a"])
+
+    async def test_least_recently_used_answer_is_evicted(self):
+        await self.ask("a")
+        await self.ask("b")
+        # A hit moves "a" to the end, so "b" is the oldest entry
+        await self.ask("a")
+        await self.ask("c")
+
+        self.assertEqual(
+            [question for question, _ in self.helper._answer_cache],
+            ["a", "c"],
+        )
+        await self.ask("a")
+        await self.ask("b")
+        self.assertEqual(
+            self.helper.qa_chain.prompts,
+            ["shirt|a", "shirt|b", "shirt|c", "shirt|b"],
+        )
+
+
+@skipIf(ai_api is None, SKIP_REASON)
+class RAGSchedulerTests(IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await self.scheduler.stop()
+
+    async def test_concurrent_questions_share_one_embedding_request(self):
+        helper = StubHelper()
+        self.scheduler = ai_api.RAGScheduler(helper)
+
+        questions = [f"question {i}" for i in range(20)]
+        results = await asyncio.gather(
+            *(self.scheduler.submit(question) for question in questions)
+        )
+
+        self.assertEqual(helper.embeddings.calls, [questions])
+        self.assertEqual([question for question, _ in results], questions)
+
+    async def test_timed_out_question_is_skipped(self):
+        gate = asyncio.Event()
+        helper = StubHelper(StubEmbeddings(gate=gate))
+        self.scheduler = ai_api.RAGScheduler(helper, concurrency=1)
+
+        first = asyncio.create_task(self.scheduler.submit("first"))
+        await asyncio.sleep(0.01)
+        with self.assertRaises(TimeoutError):
+            await self.scheduler.submit("late", timeout=0.01)
+
+        gate.set()
+        self.assertEqual((await first)[0], "first")
+        await asyncio.sleep(0.01)
+        self.assertEqual(helper.embeddings.calls, [["first"]])
+
+    async def test_embedding_failure_reaches_every_question(self):
+        error = RuntimeError("embedding service down")
+        helper = StubHelper(StubEmbeddings(error=error))
+        self.scheduler = ai_api.RAGScheduler(helper)
+
+        results = await asyncio.gather(
+            *(self.scheduler.submit(f"q{i}") for i in range(3)),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(len(helper.embeddings.calls), 1)
+        self.assertEqual(results, [error, error, error])
+
+
+@skipIf(ai_api is None, SKIP_REASON)
+class GetHelperTests(TestCase):
+    def setUp(self):
+        patcher = patch.object(ai_api, "ClaudeLLMHelper", StubHelper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(ai_api._HELPERS.clear)
+        self.addCleanup(ai_api._HELPER_LOCKS.clear)
+
+    def test_each_event_loop_gets_a_working_helper(self):
+        async def ask(question):
+            helper = await ai_api.get_helper()
+            answer = await helper.scheduler.submit(question, timeout=1)
+            return helper, answer
+
+        first_helper, first_answer = asyncio.run(ask("first"))
+        second_helper, second_answer = asyncio.run(ask("second"))
+
+        self.assertEqual(first_answer[0], "first")
+        self.assertEqual(second_answer[0], "second")
+        self.assertIsNot(first_helper, second_helper)
+        self.assertEqual(list(ai_api._HELPERS.values()), [second_helper])
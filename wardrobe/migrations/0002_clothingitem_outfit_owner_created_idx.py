@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wardrobe", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clothingitem",
+            index=models.Index(fields=["owner", "-created_at"], name="clothing_owner_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="outfit",
+            index=models.Index(fields=["owner", "-created_at"], name="outfit_owner_created_idx"),
+        ),
+    ]
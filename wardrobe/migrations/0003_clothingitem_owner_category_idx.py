@@ -0,0 +1,16 @@
+# Generated by Django 4.2.16 on 2026-10-15 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wardrobe", "0002_clothingitem_outfit_owner_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clothingitem",
+            index=models.Index(fields=["owner", "category"], name="clothing_owner_category_idx"),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-15 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wardrobe", "0003_clothingitem_owner_category_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clothingitem",
+            index=models.Index(fields=["owner", "-last_worn"], name="clothing_owner_last_worn_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="clothingitem",
+            index=models.Index(fields=["owner", "favorite"], name="clothing_owner_favorite_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="outfit",
+            index=models.Index(fields=["owner", "-last_worn"], name="outfit_owner_last_worn_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="outfit",
+            index=models.Index(fields=["owner", "favorite"], name="outfit_owner_favorite_idx"),
+        ),
+    ]
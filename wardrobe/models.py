@@ -71,6 +71,26 @@ class ClothingItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['owner', '-created_at'],
+                name='clothing_owner_created_idx'
+            ),
+            models.Index(
+                fields=['owner', 'category'],
+                name='clothing_owner_category_idx'
+            ),
+            models.Index(
+                fields=['owner', '-last_worn'],
+                name='clothing_owner_last_worn_idx'
+            ),
+            models.Index(
+                fields=['owner', 'favorite'],
+                name='clothing_owner_favorite_idx'
+            ),
+        ]
+
     def __str__(self):
         return f"{self.owner.username}'s {self.name}"
 
@@ -95,6 +115,22 @@ class Outfit(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['owner', '-created_at'],
+                name='outfit_owner_created_idx'
+            ),
+            models.Index(
+                fields=['owner', '-last_worn'],
+                name='outfit_owner_last_worn_idx'
+            ),
+            models.Index(
+                fields=['owner', 'favorite'],
+                name='outfit_owner_favorite_idx'
+            ),
+        ]
+
     def __str__(self):
         return f"{self.owner.username}'s {self.name}"
 
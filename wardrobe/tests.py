@@ -1,3 +1,235 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.pagination import StandardCursorPagination
+from core.viewsets import BaseModelViewSet
+from wardrobe.models import Category, ClothingItem
+
+
+class ClothingItemSerializer(serializers.ModelSerializer):
+    tag_ids = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False
+    )
+
+    class Meta:
+        model = ClothingItem
+        fields = [
+            'id', 'name', 'category', 'size', 'owner', 'created_at',
+            'tag_ids'
+        ]
+        read_only_fields = ['owner']
+
+    def validate(self, attrs):
+        attrs.pop('tag_ids', None)
+        return attrs
+
+
+class ClothingItemViewSet(BaseModelViewSet):
+    model_class = ClothingItem
+    serializer_class = ClothingItemSerializer
+    owner_field = 'owner'
+
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+
+
+class SmallPagePagination(StandardCursorPagination):
+    page_size = 2
+
+
+class SmallPageClothingItemViewSet(ClothingItemViewSet):
+    pagination_class = SmallPagePagination
+
+
+class UnpaginatedClothingItemViewSet(ClothingItemViewSet):
+    pagination_class = None
+
+
+class BaseModelViewSetTests(TestCase):
+    """
+    Response formats of BaseModelViewSet, exercised through ClothingItem.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user_model = get_user_model()
+        cls.owner = user_model.objects.create_user(
+            username='owner', email='owner@example.com', password='pw'
+        )
+        cls.other = user_model.objects.create_user(
+            username='other', email='other@example.com', password='pw'
+        )
+        cls.category = Category.objects.create(name='Tops')
+        for i in range(3):
+            ClothingItem.objects.create(
+                owner=cls.owner, name=f'Shirt {i}',
+                category=cls.category, size='M'
+            )
+            ClothingItem.objects.create(
+                owner=cls.other, name=f'Coat {i}',
+                category=cls.category, size='L'
+            )
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def call(self, viewset, method, action, user=None, data=None, **kwargs):
+        view = viewset.as_view({method: action})
+        if method == 'get':
+            request = self.factory.get('/', data)
+        else:
+            request = getattr(self.factory, method)('/', data, format='json')
+        if user is not None:
+            force_authenticate(request, user=user)
+        response = view(request, **kwargs)
+        response.render()
+        return response, json.loads(response.content)
+
+    def test_list_envelope(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'get', 'list', user=self.owner
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['status'], 'success')
+        self.assertEqual(body['message'], 'Retrieved successfully')
+        self.assertIsNone(body['next'])
+        self.assertIsNone(body['previous'])
+        self.assertEqual(len(body['data']), 3)
+
+    def test_list_pages_newest_first(self):
+        response, body = self.call(
+            SmallPageClothingItemViewSet, 'get', 'list', user=self.owner
+        )
+        self.assertEqual(
+            [item['name'] for item in body['data']], ['Shirt 2', 'Shirt 1']
+        )
+        self.assertIsNotNone(body['next'])
+
+        cursor = parse_qs(urlparse(body['next']).query)['cursor'][0]
+        response, body = self.call(
+            SmallPageClothingItemViewSet, 'get', 'list',
+            user=self.owner, data={'cursor': cursor}
+        )
+        self.assertEqual(
+            [item['name'] for item in body['data']], ['Shirt 0']
+        )
+        self.assertIsNotNone(body['previous'])
+
+    def test_unpaginated_list_envelope(self):
+        response, body = self.call(
+            UnpaginatedClothingItemViewSet, 'get', 'list', user=self.owner
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            body,
+            {
+                'data': body['data'],
+                'message': 'Retrieved successfully',
+                'status': 'success'
+            }
+        )
+        self.assertEqual(
+            sorted(item['name'] for item in body['data']),
+            ['Shirt 0', 'Shirt 1', 'Shirt 2']
+        )
+
+    def test_list_is_empty_for_anonymous_users(self):
+        response, body = self.call(ClothingItemViewSet, 'get', 'list')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['data'], [])
+
+    def test_list_only_returns_own_items(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'get', 'list', user=self.other
+        )
+        self.assertEqual(
+            [item['name'] for item in body['data']],
+            ['Coat 2', 'Coat 1', 'Coat 0']
+        )
+        self.assertEqual(
+            {item['owner'] for item in body['data']}, {self.other.pk}
+        )
+
+    def test_retrieve_other_owners_item_is_not_found(self):
+        item = ClothingItem.objects.filter(owner=self.owner).first()
+        response, body = self.call(
+            ClothingItemViewSet, 'get', 'retrieve',
+            user=self.other, pk=item.pk
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_field_errors_are_rendered(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'post', 'create', user=self.owner,
+            data={
+                'name': 'Hat', 'category': self.category.pk, 'size': 'S',
+                'tag_ids': [1, 'not-a-number']
+            }
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(body['errors']['tag_ids']), ['1'])
+
+    def test_create_success_envelope(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'post', 'create', user=self.owner,
+            data={'name': 'Hat', 'category': self.category.pk, 'size': 'S'}
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(body['status'], 'success')
+        self.assertEqual(body['message'], 'Created successfully')
+        self.assertEqual(body['data']['name'], 'Hat')
+        self.assertEqual(body['data']['owner'], self.owner.pk)
+
+    def test_create_validation_error_envelope(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'post', 'create', user=self.owner,
+            data={'category': self.category.pk, 'size': 'S'}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(body['data'])
+        self.assertEqual(body['message'], 'Validation error')
+        self.assertEqual(body['status'], 'error')
+        self.assertIn('name', body['errors'])
+
+    def test_create_nested_validation_error_envelope(self):
+        response, body = self.call(
+            ClothingItemViewSet, 'post', 'create', user=self.owner,
+            data={
+                'name': 'Hat', 'category': self.category.pk, 'size': 'S',
+                'tag_ids': ['x']
+            }
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(body['data'])
+        self.assertEqual(body['message'], 'Validation error')
+        self.assertEqual(body['status'], 'error')
+        self.assertEqual(list(body['errors']), ['tag_ids'])
+        self.assertEqual(len(body['errors']['tag_ids']['0']), 1)
+
+    def test_update_success_envelope(self):
+        item = ClothingItem.objects.filter(owner=self.owner).first()
+        response, body = self.call(
+            ClothingItemViewSet, 'patch', 'partial_update',
+            user=self.owner, data={'name': 'Renamed'}, pk=item.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['status'], 'success')
+        self.assertEqual(body['message'], 'Updated successfully')
+        self.assertEqual(body['data']['name'], 'Renamed')
 
-# Create your tests here.
+    def test_update_validation_error_envelope(self):
+        item = ClothingItem.objects.filter(owner=self.owner).first()
+        response, body = self.call(
+            ClothingItemViewSet, 'patch', 'partial_update',
+            user=self.owner, data={'size': ''}, pk=item.pk
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(body['data'])
+        self.assertEqual(body['message'], 'Validation error')
+        self.assertEqual(body['status'], 'error')
+        self.assertIn('size', body['errors'])